@@ -1,5 +1,6 @@
 """AWS Cloud Connector."""
 import contextlib
+import threading
 from collections.abc import Generator, Sequence
 from typing import Any, Optional, TypeVar, Union
 
@@ -44,6 +45,10 @@ T = TypeVar("T", bound="botocore.client.BaseClient")
 VALID_RECORD_TYPES = ["A", "CNAME"]
 IGNORED_TAGS = ["censys-cloud-connector-ignore"]
 
+# boto3's default session is not thread-safe when creating clients, and
+# scanners may run in parallel threads
+CLIENT_LOCK = threading.Lock()
+
 
 class AwsCloudConnector(CloudConnector):
     """AWS Cloud Connector.
@@ -213,14 +218,16 @@ class AwsCloudConnector(CloudConnector):
             credentials = credentials or self.credentials()
             if credentials.get("aws_access_key_id"):
                 self.logger.debug(f"AWS Service {service} using access key credentials")
-                return boto3.client(service, **credentials)  # type: ignore
+                with CLIENT_LOCK:
+                    return boto3.client(service, **credentials)  # type: ignore
 
             # calling client without credentials follows the standard
             # credential import path to source creds from the environment
             self.logger.debug(
                 f"AWS Service {service} using external boto configuration"
             )
-            return boto3.client(service)  # type: ignore
+            with CLIENT_LOCK:
+                return boto3.client(service)  # type: ignore
         except Exception as e:
             self.logger.error(
                 f"Could not connect with client type '{service}'. Error: {e}"
@@ -92,31 +92,65 @@ class AzureCloudConnector(CloudConnector):
         provider_settings: dict[
             tuple, AzureSpecificSettings
         ] = self.settings.providers.get(self.provider, {})
+        subscriptions = []
         for provider_setting in provider_settings.values():
-            self.provider_settings = provider_setting
-            self.credentials = ClientSecretCredential(
+            # Subscriptions of the same service principal share its credential
+            credentials = ClientSecretCredential(
                 tenant_id=provider_setting.tenant_id,
                 client_id=provider_setting.client_id,
                 client_secret=provider_setting.client_secret,
             )
-            for subscription_id in self.provider_settings.subscription_id:
-                self.logger.info(f"Scanning Azure Subscription {subscription_id}")
-                self.subscription_id = subscription_id
-                try:
-                    if self.scan_all_regions:
-                        self.get_all_labels()
-
-                    self.scan()
-
-                    if self.scan_all_regions:
-                        for label_not_found in self.possible_labels:
-                            self.delete_seeds_by_label(label_not_found)
-                except Exception as e:
-                    self.logger.error(
-                        f"Unable to scan Azure Subscription {subscription_id}. Error: {e}"
-                    )
-                    self.dispatch_event(EventTypeEnum.SCAN_FAILED, exception=e)
-                self.subscription_id = None
+            for subscription_id in provider_setting.subscription_id:
+                subscriptions.append((provider_setting, credentials, subscription_id))
+        self._scan_many(
+            subscriptions, lambda subscription: self.scan_subscription(*subscription)
+        )
+
+    def scan_subscription(
+        self,
+        provider_setting: AzureSpecificSettings,
+        credentials: ClientSecretCredential,
+        subscription_id: str,
+    ):
+        """Scan a single Azure Subscription.
+
+        Subscriptions are scanned concurrently, so each one is scanned by a new
+        connector with its own seeds, cloud assets and labels.
+
+        Args:
+            provider_setting (AzureSpecificSettings): Azure specific settings.
+            credentials (ClientSecretCredential): Azure credentials.
+            subscription_id (str): Azure Subscription ID.
+        """
+        self.logger.info(f"Scanning Azure Subscription {subscription_id}")
+        try:
+            connector = type(self)(self.settings)
+        except Exception as e:
+            # Without a subscription connector, report on this one instead
+            self.logger.error(
+                f"Unable to scan Azure Subscription {subscription_id}. Error: {e}"
+            )
+            self.dispatch_event(
+                EventTypeEnum.SCAN_FAILED, exception=e, subscription_id=subscription_id
+            )
+            return
+        connector.provider_settings = provider_setting
+        connector.credentials = credentials
+        connector.subscription_id = subscription_id
+        try:
+            if connector.scan_all_regions:
+                connector.get_all_labels()
+
+            connector.scan()
+
+            if connector.scan_all_regions:
+                for label_not_found in connector.possible_labels:
+                    connector.delete_seeds_by_label(label_not_found)
+        except Exception as e:
+            connector.logger.error(
+                f"Unable to scan Azure Subscription {subscription_id}. Error: {e}"
+            )
+            connector.dispatch_event(EventTypeEnum.SCAN_FAILED, exception=e)
 
     def format_label(self, asset: AzureModel) -> str:
         """Format Azure asset label.
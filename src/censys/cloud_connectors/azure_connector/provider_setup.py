@@ -1,10 +1,16 @@
 """Azure specific setup CLI."""
 import contextlib
+import shutil
 from typing import Optional
 
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
-from azure.identity import ClientSecretCredential
+from azure.identity import (
+    AzureCliCredential,
+    ClientSecretCredential,
+    CredentialUnavailableError,
+)
 from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.resource import SubscriptionClient
 from pydantic import validate_arguments
 
 from censys.cloud_connectors.azure_connector.enums import AzureMessages
@@ -21,29 +27,41 @@ class AzureSetupCli(ProviderSetupCli):
 
     provider = ProviderEnum.AZURE
     provider_specific_settings_class = AzureSpecificSettings
+    cli_subscription_client: Optional[SubscriptionClient] = None
+
+    def get_cli_subscription_client(self) -> SubscriptionClient:
+        """Get a subscription client authenticated with the Azure CLI.
+
+        The client is created once and reused, so the token its pipeline
+        fetched from the CLI is reused on later calls.
+
+        Returns:
+            SubscriptionClient: Subscription client.
+        """
+        if self.cli_subscription_client is None:
+            self.cli_subscription_client = SubscriptionClient(AzureCliCredential())
+        return self.cli_subscription_client
 
     def get_subscriptions_from_cli(self) -> list[dict[str, str]]:
-        """Get subscriptions from the CLI.
+        """Get enabled subscriptions from the CLI.
 
         Returns:
-            List[Dict[str, str]]: List of subscriptions.
+            List[Dict[str, str]]: List of enabled subscriptions.
         """
+        # The CLI credential shells out to az, so fail fast if it is missing
+        if not shutil.which("az"):
+            self.print_warning("Please install the Azure CLI")
+            return []
+
+        subscription_client = self.get_cli_subscription_client()
         try:
-            from azure.identity import AzureCliCredential
-            from azure.identity._exceptions import CredentialUnavailableError
-            from azure.mgmt.resource import SubscriptionClient
-
-            credential = AzureCliCredential()
-            subscription_client = SubscriptionClient(credential)
-            try:
-                subscriptions = [
-                    s.as_dict() for s in subscription_client.subscriptions.list()
-                ]
-                return subscriptions
-            except CredentialUnavailableError:
-                self.print_warning("Unable to get subscriptions from the CLI")
-        except ImportError:
-            self.print_warning("Please install the Azure SDK for Python")
+            return [
+                s.as_dict()
+                for s in subscription_client.subscriptions.list()
+                if s.state == "Enabled"
+            ]
+        except CredentialUnavailableError:
+            self.print_warning("Unable to get subscriptions from the CLI")
         return []
 
     def prompt_select_subscriptions(
@@ -52,7 +70,7 @@ class AzureSetupCli(ProviderSetupCli):
         """Prompt the user to select subscriptions.
 
         Args:
-            subscriptions (List[Dict[str, str]]): List of subscriptions.
+            subscriptions (List[Dict[str, str]]): List of enabled subscriptions.
 
         Returns:
             List[Dict[str, str]]: List of selected subscriptions.
@@ -81,7 +99,6 @@ class AzureSetupCli(ProviderSetupCli):
                         "value": s,
                     }
                     for s in subscriptions
-                    if s.get("state") == "Enabled"
                 ],
                 "multiselect": True,
             }
@@ -1,5 +1,6 @@
 """Base for all cli commands."""
 
+import shlex
 import subprocess
 from typing import Optional, Union
 
@@ -69,11 +70,14 @@ def print_question(message: str) -> None:
 def print_command(command: Union[str, list[str]]) -> None:
     """Print a command.
 
+    Argument lists are quoted for the shell, so the printed command can be
+    copied and run as is.
+
     Args:
         command (Union[str, list[str]]): The command(s) to print.
     """
     if isinstance(command, list):
-        command = " ".join(command)
+        command = shlex.join(command)
     print()
     print(Syntax(command, "bash", word_wrap=True))
     print()
@@ -19,15 +19,20 @@ class CloudAsset(HashableBaseModel):
     def to_dict(self) -> dict[str, str]:
         """Convert the cloud asset to a dictionary.
 
+        The dictionary is cached until a field is assigned, and should not be
+        modified.
+
         Returns:
             Dictionary representation of the cloud asset.
         """
-        return {
-            "type": self.type,
-            "value": self.value,
-            "cspLabel": self.csp_label.label(),
-            "scanData": json.dumps(self.scan_data),
-        }
+        if self._dict is None:
+            self._dict = {
+                "type": self.type,
+                "value": self.value,
+                "cspLabel": self.csp_label.label(),
+                "scanData": json.dumps(self.scan_data),
+            }
+        return self._dict
 
 
 class ObjectStorageAsset(CloudAsset):
@@ -1,11 +1,19 @@
 """Base class for all cloud connectors."""
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from enum import Enum
-from logging import Logger
-from typing import Callable, Optional, Union
+from functools import cached_property
+from logging import DEBUG, Logger
+from typing import Callable, Optional, TypeVar, Union, cast
+from weakref import WeakValueDictionary
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from censys.asm import Beta, Seeds
+from censys.asm.api import CensysAsmAPI
 from censys.common.exceptions import CensysAsmException
 
 from .cloud_asset import CloudAsset
@@ -16,6 +24,31 @@ from .plugins import CloudConnectorPluginRegistry, EventContext
 from .seed import Seed
 from .settings import ProviderSpecificSettings, Settings
 
+A = TypeVar("A", bound=CensysAsmAPI)
+T = TypeVar("T")
+
+# The service being scanned, local to each scanner thread
+_current_service: ContextVar[Optional[Union[str, Enum]]] = ContextVar(
+    "current_service", default=None
+)
+
+
+def _run_concurrently(
+    func: Callable[[T], None], items: Iterable[T], max_workers: int
+) -> None:
+    """Call a function on each item in a thread pool and wait for all of them.
+
+    Args:
+        func (Callable[[T], None]): The function to call.
+        items (Iterable[T]): The items to call it with.
+        max_workers (int): The maximum number of concurrent calls.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results only so that exceptions raised in the workers are
+        # re-raised here, executor.map would otherwise swallow them
+        for _ in executor.map(func, items):
+            pass
+
 
 class CloudConnector(ABC):
     """Base class for Cloud Connectors."""
@@ -26,12 +59,63 @@ class CloudConnector(ABC):
     settings: Settings
     logger: Logger
     seeds_api: Seeds
-    beta_api: Beta
     seeds: dict[str, set[Seed]]
     cloud_assets: dict[str, set[CloudAsset]]
     seed_scanners: dict[str, Callable[[], None]]
     cloud_asset_scanners: dict[str, Callable[[], None]]
-    current_service: Optional[Union[str, Enum]]
+
+    # ASM API clients shared between connectors with the same credentials
+    _api_clients: "WeakValueDictionary[tuple, CensysAsmAPI]" = WeakValueDictionary()
+
+    @classmethod
+    def _get_or_create_api(cls, api_cls: type[A], settings: Settings) -> A:
+        """Get a shared ASM API client, creating it if needed.
+
+        Connectors created with the same credentials reuse the same client, and
+        therefore the same pooled HTTP session.
+
+        Args:
+            api_cls (type[A]): The ASM API client class.
+            settings (Settings): The settings to use.
+
+        Returns:
+            A: The ASM API client.
+        """
+        key = (
+            api_cls,
+            settings.censys_api_key,
+            settings.censys_asm_api_base_url,
+            settings.censys_user_agent,
+            tuple(sorted(settings.censys_cookies.items())),
+            settings.censys_max_retries,
+            settings.max_concurrent_submissions,
+            settings.max_concurrent_subscriptions,
+        )
+        api = cls._api_clients.get(key)
+        if api is None:
+            # The client retries rate limited and failed requests itself, with
+            # jittered exponential backoff that honors Retry-After
+            api = api_cls(
+                settings.censys_api_key,
+                url=settings.censys_asm_api_base_url,
+                user_agent=settings.censys_user_agent,
+                cookies=settings.censys_cookies,
+                max_retries=settings.censys_max_retries,
+            )
+            # Every concurrently scanned subscription submits through its own
+            # pool, all sharing this session
+            adapter = HTTPAdapter(
+                pool_maxsize=max(
+                    settings.max_concurrent_submissions
+                    * settings.max_concurrent_subscriptions,
+                    DEFAULT_POOLSIZE,
+                )
+            )
+            api._session.mount("https://", adapter)
+            api._session.mount("http://", adapter)
+            cls._api_clients[key] = api
+        # The key includes api_cls, so a cached client is always an api_cls
+        return cast(A, api)
 
     def __init__(self, settings: Settings):
         """Initialize the Cloud Connector.
@@ -51,22 +135,21 @@ class CloudConnector(ABC):
             level=settings.logging_level,
         )
 
-        self.seeds_api = Seeds(
-            settings.censys_api_key,
-            url=settings.censys_asm_api_base_url,
-            user_agent=settings.censys_user_agent,
-            cookies=settings.censys_cookies,
-        )
-        self.beta_api = Beta(
-            settings.censys_api_key,
-            url=settings.censys_asm_api_base_url,
-            user_agent=settings.censys_user_agent,
-            cookies=settings.censys_cookies,
-        )
+        self.seeds_api = self._get_or_create_api(Seeds, settings)
 
         self.seeds = defaultdict(set)
         self.cloud_assets = defaultdict(set)
-        self.current_service = None
+
+    @cached_property
+    def beta_api(self) -> Beta:
+        """Get the ASM Beta API client, creating it on first use.
+
+        Only cloud asset submission uses it, so seed-only scans never set it up.
+
+        Returns:
+            Beta: The ASM Beta API client.
+        """
+        return self._get_or_create_api(Beta, self.settings)
 
     def delete_seeds_by_label(self, label: str):
         """Replace seeds for [label] with an empty list.
@@ -85,36 +168,62 @@ class CloudConnector(ABC):
             self.logger.info(f"Deleted any seeds for label {label}.")
             self.dispatch_event(EventTypeEnum.SEEDS_DELETED, label=label)
 
-    def get_seeds(self) -> None:
-        """Gather seeds."""
-        for seed_type, seed_scanner in self.seed_scanners.items():
-            self.current_service = seed_type
+    def _run_scanners(
+        self,
+        scanners: dict[str, Callable[[], None]],
+        run_scanner: Callable[[str, Callable[[], None]], None],
+    ) -> None:
+        """Run the scanners that are not ignored.
+
+        Up to ``settings.max_concurrent_scans`` scanners run at a time. An
+        exception raised by ``run_scanner`` is re-raised once it is reached.
+
+        Args:
+            scanners (dict[str, Callable[[], None]]): The scanners by service.
+            run_scanner (Callable[[str, Callable[[], None]], None]): Runs a
+                single scanner.
+        """
+        enabled_scanners = []
+        for service, scanner in scanners.items():
             if (
                 self.provider_settings.ignore
-                and seed_type in self.provider_settings.ignore
+                and service in self.provider_settings.ignore
             ):
-                self.logger.debug(f"Skipping {seed_type}")
+                self.logger.debug(f"Skipping {service}")
                 continue
-            self.logger.debug(f"Scanning {seed_type}")
+            enabled_scanners.append((service, scanner))
+
+        def run(service: str, scanner: Callable[[], None]) -> None:
+            token = _current_service.set(service)
+            self.logger.debug(f"Scanning {service}")
+            try:
+                run_scanner(service, scanner)
+            finally:
+                _current_service.reset(token)
+
+        _run_concurrently(
+            lambda item: run(*item),
+            enabled_scanners,
+            self.settings.max_concurrent_scans,
+        )
+
+    def get_seeds(self) -> None:
+        """Gather seeds."""
+
+        def run_seed_scanner(seed_type: str, seed_scanner: Callable[[], None]):
             try:
                 seed_scanner()
             except CensysCloudProviderException as e:
                 self.logger.error(f"Error scanning {seed_type}: {e}")
-        self.current_service = None
+
+        self._run_scanners(self.seed_scanners, run_seed_scanner)
 
     def get_cloud_assets(self) -> None:
         """Gather cloud assets."""
-        for cloud_asset_type, cloud_asset_scanner in self.cloud_asset_scanners.items():
-            self.current_service = cloud_asset_type
-            if (
-                self.provider_settings.ignore
-                and cloud_asset_type in self.provider_settings.ignore
-            ):
-                self.logger.debug(f"Skipping {cloud_asset_type}")
-                continue
-            self.logger.debug(f"Scanning {cloud_asset_type}")
-            cloud_asset_scanner()
-        self.current_service = None
+        self._run_scanners(
+            self.cloud_asset_scanners,
+            lambda _, cloud_asset_scanner: cloud_asset_scanner(),
+        )
 
     def get_event_context(
         self,
@@ -134,7 +243,7 @@ class CloudConnector(ABC):
             "event_type": event_type,
             "connector": self,
             "provider": self.provider,
-            "service": service or self.current_service,
+            "service": service or _current_service.get(),
         }
 
     def dispatch_event(
@@ -163,7 +272,8 @@ class CloudConnector(ABC):
         if not seed.label.startswith(self.label_prefix):
             seed.label = self.label_prefix + seed.label
         self.seeds[seed.label].add(seed)
-        self.logger.debug(f"Found Seed: {seed.to_dict()}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"Found Seed: {seed.to_dict()}")
         self.dispatch_event(EventTypeEnum.SEED_FOUND, seed=seed, **kwargs)
 
     def add_cloud_asset(self, cloud_asset: CloudAsset, **kwargs):
@@ -176,36 +286,87 @@ class CloudConnector(ABC):
         if not cloud_asset.uid.startswith(self.label_prefix):
             cloud_asset.uid = self.label_prefix + cloud_asset.uid
         self.cloud_assets[cloud_asset.uid].add(cloud_asset)
-        self.logger.debug(f"Found Cloud Asset: {cloud_asset.to_dict()}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"Found Cloud Asset: {cloud_asset.to_dict()}")
         self.dispatch_event(
             EventTypeEnum.CLOUD_ASSET_FOUND, cloud_asset=cloud_asset, **kwargs
         )
 
+    def _submit_seeds_for_label(self, label: str, seeds: list[dict]) -> int:
+        """Submit the seeds for a single label to Censys ASM.
+
+        Args:
+            label (str): The seed label.
+            seeds (list[dict]): The serialized seeds.
+
+        Returns:
+            int: The number of seeds submitted.
+        """
+        try:
+            self.seeds_api.replace_seeds_by_label(label, seeds)
+            return len(seeds)
+        except CensysAsmException as e:
+            self.logger.error(f"Error submitting seeds for {label}: {e}")
+            return 0
+
     def submit_seeds(self):
-        """Submit the seeds to Censys ASM."""
-        submitted_seeds = 0
-        for label, seeds in self.seeds.items():
-            try:
-                self.seeds_api.replace_seeds_by_label(
-                    label, [seed.to_dict() for seed in seeds]
+        """Submit the seeds to Censys ASM.
+
+        Each label is submitted in its own request, up to
+        ``settings.max_concurrent_submissions`` requests at a time.
+        """
+        payloads = [
+            (label, [seed.to_dict() for seed in seeds])
+            for label, seeds in self.seeds.items()
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.settings.max_concurrent_submissions
+        ) as executor:
+            submitted_seeds = sum(
+                executor.map(
+                    lambda payload: self._submit_seeds_for_label(*payload),
+                    payloads,
                 )
-                submitted_seeds += len(seeds)
-            except CensysAsmException as e:
-                self.logger.error(f"Error submitting seeds for {label}: {e}")
+            )
         self.logger.info(f"Submitted {submitted_seeds} seeds.")
         self.dispatch_event(EventTypeEnum.SEEDS_SUBMITTED, count=submitted_seeds)
 
+    def _submit_cloud_assets_for_uid(self, uid: str, cloud_assets: list[dict]) -> int:
+        """Submit the cloud assets for a single uid to Censys ASM.
+
+        Args:
+            uid (str): The cloud connector uid.
+            cloud_assets (list[dict]): The serialized cloud assets.
+
+        Returns:
+            int: The number of cloud assets submitted.
+        """
+        try:
+            self.beta_api.add_cloud_assets(uid, cloud_assets)
+            return len(cloud_assets)
+        except CensysAsmException as e:
+            self.logger.error(f"Error submitting cloud assets for {uid}: {e}")
+            return 0
+
     def submit_cloud_assets(self):
-        """Submit the cloud assets to Censys ASM."""
-        submitted_assets = 0
-        for uid, cloud_assets in self.cloud_assets.items():
-            try:
-                self.beta_api.add_cloud_assets(
-                    uid, [asset.to_dict() for asset in cloud_assets]
+        """Submit the cloud assets to Censys ASM.
+
+        Each uid is submitted in its own request, up to
+        ``settings.max_concurrent_submissions`` requests at a time.
+        """
+        payloads = [
+            (uid, [asset.to_dict() for asset in cloud_assets])
+            for uid, cloud_assets in self.cloud_assets.items()
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.settings.max_concurrent_submissions
+        ) as executor:
+            submitted_assets = sum(
+                executor.map(
+                    lambda payload: self._submit_cloud_assets_for_uid(*payload),
+                    payloads,
                 )
-                submitted_assets += len(cloud_assets)
-            except CensysAsmException as e:
-                self.logger.error(f"Error submitting cloud assets for {uid}: {e}")
+            )
         self.logger.info(f"Submitted {submitted_assets} cloud assets.")
         self.dispatch_event(
             EventTypeEnum.CLOUD_ASSETS_SUBMITTED, count=submitted_assets
@@ -269,6 +430,19 @@ class CloudConnector(ABC):
         self.submit()
         self.dispatch_event(EventTypeEnum.SCAN_FINISHED)
 
+    def _scan_many(self, items: Iterable[T], scan_item: Callable[[T], None]) -> None:
+        """Scan several items, such as subscriptions, concurrently.
+
+        Up to ``settings.max_concurrent_subscriptions`` items are scanned at a
+        time. Items run in parallel, so ``scan_item`` should scan each one on
+        its own connector rather than storing per-item state on this one.
+
+        Args:
+            items (Iterable[T]): The items to scan.
+            scan_item (Callable[[T], None]): Scans a single item.
+        """
+        _run_concurrently(scan_item, items, self.settings.max_concurrent_subscriptions)
+
     @abstractmethod
     def scan_all(self):
         """Scan all the seeds and cloud assets."""
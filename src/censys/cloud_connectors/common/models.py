@@ -1,10 +1,26 @@
 """Models for the Cloud Connectors."""
-from pydantic import BaseModel
+from typing import Any, Optional
+
+from pydantic import BaseModel, PrivateAttr
 
 
 class HashableBaseModel(BaseModel):
     """Base class for hashable models."""
 
+    # Cached result of to_dict, cleared whenever a field is assigned
+    _dict: Optional[dict] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        """Set an attribute, clearing the cached dictionary for fields.
+
+        Args:
+            name (str): The attribute name.
+            value (Any): The attribute value.
+        """
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._dict = None
+
     def __hash__(self) -> int:
         """Return the hash of the model.
 
@@ -18,12 +18,15 @@ class Seed(HashableBaseModel):
     def to_dict(self) -> dict[str, Union[str, int]]:
         """Convert the seed to a dictionary.
 
-        Please note that the label should not be included.
+        Please note that the label should not be included. The dictionary is
+        cached until a field is assigned, and should not be modified.
 
         Returns:
             Dictionary representation of the seed.
         """
-        return {"type": self.type, "value": self.value}
+        if self._dict is None:
+            self._dict = {"type": self.type, "value": self.value}
+        return self._dict
 
 
 class AsnSeed(Seed):
@@ -157,6 +157,12 @@ class Settings(BaseSettings):
     censys_cookies: dict = Field(
         default={}, env="CENSYS_COOKIES", description="Censys Cookies"
     )
+    censys_max_retries: int = Field(
+        default=5,
+        ge=1,
+        env="CENSYS_MAX_RETRIES",
+        description="Maximum number of attempts for each Censys ASM API request",
+    )
 
     # Optional
     providers_config_file: str = Field(
@@ -189,6 +195,24 @@ class Settings(BaseSettings):
         env="AZURE_REFRESH_ALL_REGIONS",
         description="Scan all available Azure regions",
     )
+    max_concurrent_submissions: int = Field(
+        default=8,
+        ge=1,
+        env="MAX_CONCURRENT_SUBMISSIONS",
+        description="Maximum number of concurrent submissions to Censys ASM",
+    )
+    max_concurrent_scans: int = Field(
+        default=4,
+        ge=1,
+        env="MAX_CONCURRENT_SCANS",
+        description="Maximum number of services scanned concurrently per connector",
+    )
+    max_concurrent_subscriptions: int = Field(
+        default=4,
+        ge=1,
+        env="MAX_CONCURRENT_SUBSCRIPTIONS",
+        description="Maximum number of subscriptions scanned concurrently",
+    )
 
     # Verification timeout
     validation_timeout: int = Field(
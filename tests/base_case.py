@@ -1,5 +1,6 @@
-import json
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 import pytest
 from pytest_mock import MockerFixture
@@ -20,21 +21,34 @@ class BaseCase:
     """
 
     mocker: MockerFixture
-    shared_datadir: Path
-    default_settings: dict
+    default_settings: Mapping[str, Any]
 
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker: MockerFixture, shared_datadir: Path):
+    def __inject_fixtures(
+        self,
+        request: pytest.FixtureRequest,
+        mocker: MockerFixture,
+        default_settings: Mapping[str, Any],
+    ):
         """Injects fixtures into the test case."""
+        # Keep the request to resolve the shared data directory on demand
+        self._request = request
         # Inject mocker fixture
         self.mocker = mocker
-        # Inject shared data directory fixture
-        self.shared_datadir = shared_datadir
+        # Inject session-cached default settings
+        self.default_settings = default_settings
 
-    def setUp(self):
-        """Sets up the test case."""
-        with open(self.shared_datadir / "default_settings.json") as f:
-            self.default_settings = json.load(f)
+    @property
+    def shared_datadir(self) -> Path:
+        """Per-test copy of the shared data directory.
+
+        pytest-datadir copies the whole directory, so it is only requested by
+        tests that use it. Read-only data should come from tests.utils.
+
+        Returns:
+            Path: The shared data directory.
+        """
+        return self._request.getfixturevalue("shared_datadir")
 
     def tearDown(self) -> None:
         """Tears down the test case."""
@@ -5,6 +5,7 @@ from censys.cloud_connectors.common.enums import ProviderEnum
 from censys.cloud_connectors.common.seed import Seed
 from censys.cloud_connectors.common.settings import Settings
 from tests.base_case import BaseCase
+from tests.utils import DATA_DIR
 
 
 class BaseConnectorCase(BaseCase):
@@ -20,21 +21,19 @@ class BaseConnectorCase(BaseCase):
         super().setUp()
         self.settings = Settings(
             **self.default_settings,
-            providers_config_file=str(self.shared_datadir / "test_empty_providers.yml"),
+            providers_config_file=str(DATA_DIR / "test_empty_providers.yml"),
         )
 
     def tearDown(self) -> None:
         super().tearDown()
-        # Reset the deaultdicts (seeds and cloud_assets) as they are immutable
-        for seed_key in list(self.connector.seeds.keys()):
-            del self.connector.seeds[seed_key]
-        for cloud_asset_key in list(self.connector.cloud_assets.keys()):
-            del self.connector.cloud_assets[cloud_asset_key]
+        # Reset the defaultdicts (seeds and cloud_assets)
+        self.connector.seeds.clear()
+        self.connector.cloud_assets.clear()
 
     def assert_seeds_with_values(self, seeds: set[Seed], values: list[str]):
         """Assert that the seeds have the expected values.
 
-        Each Seed type has a value property which is compared against the values array in order.
+        Each Seed type has a value property, the set of which is compared against the values.
 
         Args:
             seeds (set[Seed]): The seeds.
@@ -43,17 +42,13 @@ class BaseConnectorCase(BaseCase):
         Raises:
             AssertionError: If the seeds do not have the expected values.
         """
-        # seeds_len = len(seeds)
-        # values_len = len(values)
-        # assert seeds_len == values_len, f"Expected {values_len} seeds, got {seeds_len}"
-        seed_values = [seed.value for seed in seeds]
-        seed_values.sort()
-        values.sort()
-        assert values == seed_values, f"Expected {values}, got {seed_values}"
-        # for seed in seeds:
-        #     assert (
-        #         seed.value in values
-        #     ), f"The seed {seed.value} is not in the expected values {values}"
+        seed_values = {seed.value for seed in seeds}
+        assert len(seeds) == len(
+            values
+        ), f"Expected {len(values)} seeds, got {len(seeds)}"
+        assert seed_values == set(
+            values
+        ), f"Expected {sorted(values)}, got {sorted(seed_values)}"
 
     def mock_healthcheck(self) -> MagicMock:
         """Mock the healthcheck.
@@ -0,0 +1,16 @@
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from tests.utils import load_test_data
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Mapping[str, Any]:
+    """Default settings shared by every test.
+
+    Returns:
+        Mapping[str, Any]: The parsed, read-only default settings.
+    """
+    return load_test_data("default_settings.json")
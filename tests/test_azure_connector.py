@@ -1,52 +1,145 @@
-import json
-from unittest import TestCase
-from unittest.mock import MagicMock
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
 
 import pytest
-from parameterized import parameterized
 
-from censys.cloud_connectors.azure_connector.enums import AzureResourceTypes
-from censys.cloud_connectors.common.enums import ProviderEnum
+from censys.cloud_connectors.common.enums import EventTypeEnum, ProviderEnum
 from censys.cloud_connectors.common.exceptions import CensysAzureException
+from censys.cloud_connectors.common.settings import Settings
 from tests.base_connector_case import BaseConnectorCase
+from tests.utils import DATA_DIR, load_test_data
+
+# Skip the whole module when the Azure SDK is not installed, or only partly
+pytest.importorskip("azure.core.exceptions", reason="Azure SDK not installed")
+pytest.importorskip(
+    "censys.cloud_connectors.azure_connector", reason="Azure SDK not installed"
+)
+
+from azure.core.exceptions import (  # noqa: E402
+    ClientAuthenticationError,
+    HttpResponseError,
+)
+
+from censys.cloud_connectors.azure_connector import AzureCloudConnector  # noqa: E402
+from censys.cloud_connectors.azure_connector.enums import (  # noqa: E402
+    AzureResourceTypes,
+)
+from censys.cloud_connectors.azure_connector.settings import (  # noqa: E402
+    AzureSpecificSettings,
+)
+
+
+def mock_asset(data: dict) -> SimpleNamespace:
+    asset = SimpleNamespace(**data)
+    asset.as_dict = lambda: data
+    return asset
+
+
+def ip_address_responses(template: dict, count: int) -> tuple[list[dict], list[str]]:
+    prefix = template["ip_address"][:-1]
+    ip_addresses = [prefix + str(i) for i in range(count)]
+    return [{**template, "ip_address": ip} for ip in ip_addresses], ip_addresses
+
+
+def container_group_responses(
+    template: dict, count: int
+) -> tuple[list[dict], list[str]]:
+    base_ip_address = template["ip_address"]
+    prefix = base_ip_address["ip"][:-1]
+    ip_addresses = [
+        {
+            **base_ip_address,
+            "ip": prefix + str(i),
+            "fqdn": f"test-{i}.eastus.azurecontainer.io",
+        }
+        for i in range(count)
+    ]
+    seed_values = [
+        value
+        for ip_address in ip_addresses
+        for value in (ip_address["ip"], ip_address["fqdn"])
+    ]
+    return [{**template, "ip_address": ip} for ip in ip_addresses], seed_values
 
-failed_import = False
-try:
-    from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
 
-    from censys.cloud_connectors.azure_connector import AzureCloudConnector
-    from censys.cloud_connectors.azure_connector.settings import AzureSpecificSettings
-except ImportError:
-    failed_import = True
+def sql_server_responses(template: dict, count: int) -> tuple[list[dict], list[str]]:
+    suffix = template["fully_qualified_domain_name"]
+    domains = [f"test-{i}{suffix}" for i in range(count)]
+    return [
+        {**template, "fully_qualified_domain_name": domain} for domain in domains
+    ], domains
 
 
-@pytest.mark.skipif(failed_import, reason="Azure SDK not installed")
-class TestAzureCloudConnector(BaseConnectorCase, TestCase):
+class TestAzureCloudConnector(BaseConnectorCase):
     connector: AzureCloudConnector
     connector_cls = AzureCloudConnector
-
-    def setUp(self) -> None:
-        super().setUp()
-        with open(self.shared_datadir / "test_azure_responses.json") as f:
-            self.data = json.load(f)
+    data: Mapping[str, Any]
+    credentials: SimpleNamespace
+    patched_clients = (
+        "NetworkManagementClient",
+        "ContainerInstanceManagementClient",
+        "SqlManagementClient",
+        "DnsManagementClient",
+        "StorageManagementClient",
+        "BlobServiceClient",
+    )
+    mock_clients: dict[str, MagicMock]
+    # The providers file is only read, so point at the source copy directly
+    providers_config_file = str(DATA_DIR / "test_empty_providers.yml")
+
+    @pytest.fixture(autouse=True, scope="class")
+    def _setup_class(self, request: pytest.FixtureRequest) -> Iterator[None]:
+        """Load the test data and patch the clients once per class."""
+        cls = request.cls
+        # Tests only copy from the responses, so they are parsed once per session
+        cls.data = load_test_data("test_azure_responses.json")
+        # The clients are mocked, only the tenant id is ever read from credentials
+        cls.credentials = SimpleNamespace(
+            _tenant_id=cls.data["TEST_CREDS"]["tenant_id"]
+        )
+        with ExitStack() as stack:
+            # Patch the management clients once, each test resets them
+            cls.mock_clients = {
+                client_name: stack.enter_context(
+                    patch(
+                        f"censys.cloud_connectors.azure_connector.connector.{client_name}"
+                    )
+                )
+                for client_name in cls.patched_clients
+            }
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _setup_connector(self, default_settings: Mapping[str, Any]) -> None:
+        """Give each test a fresh connector."""
+        for mock_client in self.mock_clients.values():
+            mock_client.reset_mock(return_value=True, side_effect=True)
         test_azure_settings = AzureSpecificSettings.from_dict(self.data["TEST_CREDS"])
+        self.settings = Settings(
+            **default_settings,
+            providers_config_file=self.providers_config_file,
+        )
         self.settings.providers[ProviderEnum.AZURE] = {
             test_azure_settings.get_provider_key(): test_azure_settings
         }
         self.connector = AzureCloudConnector(self.settings)
         # Set subscription_id as its required for certain calls
         self.connector.subscription_id = self.data["TEST_CREDS"]["subscription_id"]
-        self.connector.credentials = self.mocker.MagicMock()
+        self.connector.credentials = self.credentials
         self.connector.provider_settings = test_azure_settings
 
-    def mock_asset(self, data: dict) -> MagicMock:
-        asset = self.mocker.MagicMock()
-        for key, value in data.items():
-            asset.__setattr__(key, value)
-        asset.as_dict.return_value = data
-        return asset
+    def expected_label(self, location: str) -> str:
+        # Every mocked asset in a test shares its template's location
+        return (
+            f"{self.connector.label_prefix}{self.connector.subscription_id}/{location}"
+        )
 
     def mock_client(self, client_name: str) -> MagicMock:
+        if client_name in self.mock_clients:
+            return self.mock_clients[client_name]
         return self.mocker.patch(
             f"censys.cloud_connectors.azure_connector.connector.{client_name}"
         )
@@ -61,18 +154,17 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
             "censys.cloud_connectors.azure_connector.connector.Healthcheck"
         )
 
-    @parameterized.expand([(ClientAuthenticationError,)])
-    def test_scan_fail(self, exception):
+    def test_scan_fail(self):
         # Mock super().scan()
         mock_scan = self.mocker.patch.object(
             self.connector.__class__.__bases__[0],
             "scan",
-            side_effect=exception,
+            side_effect=ClientAuthenticationError,
         )
         mock_healthcheck = self.mock_healthcheck()
 
         # Actual call
-        with pytest.raises(exception):
+        with pytest.raises(ClientAuthenticationError):
             self.connector.scan()
 
         # Assertions
@@ -82,14 +174,14 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
     def test_scan_all(self):
         # Test data
         test_single_subscription = self.data["TEST_CREDS"]
-        test_multiple_subscriptions = test_single_subscription.copy()
-        test_multiple_subscriptions["client_id"] = test_multiple_subscriptions[
-            "client_id"
-        ].replace("x", "y")
-        test_multiple_subscriptions["subscription_id"] = [
-            test_multiple_subscriptions["subscription_id"],
-            test_multiple_subscriptions["subscription_id"].replace("x", "y"),
-        ]
+        test_multiple_subscriptions = {
+            **test_single_subscription,
+            "client_id": test_single_subscription["client_id"].replace("x", "y"),
+            "subscription_id": [
+                test_single_subscription["subscription_id"],
+                test_single_subscription["subscription_id"].replace("x", "y"),
+            ],
+        }
         test_azure_settings = [
             AzureSpecificSettings.from_dict(test_single_subscription),
             AzureSpecificSettings.from_dict(test_multiple_subscriptions),
@@ -98,34 +190,123 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
             p.get_provider_key(): p for p in test_azure_settings
         }
         self.connector.settings.providers[self.connector.provider] = provider_settings
-        test_possible_labels = [
-            "Azure: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/global",
-            "Azure: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/eastus",
-            "Azure: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/southcentralus",
-            "Azure: yyyyyyyy-yyyy-yyyy-yyyy-yyyyyyyyyyyy/global",
-            "Azure: yyyyyyyy-yyyy-yyyy-yyyy-yyyyyyyyyyyy/eastus",
-            "Azure: yyyyyyyy-yyyy-yyyy-yyyy-yyyyyyyyyyyy/southcentralus",
-        ]
 
-        # Mock scan
-        mock_scan = self.mocker.patch.object(self.connector, "scan")
+        # Mock
+        self.mock_client("ClientSecretCredential")
+        mock_scan_subscription = self.mocker.patch.object(
+            self.connector, "scan_subscription"
+        )
+
+        # Actual call
+        self.connector.scan_all()
+
+        # Assertions
+        assert mock_scan_subscription.call_count == 3
+        scanned_subscriptions = {
+            call.args[2] for call in mock_scan_subscription.call_args_list
+        }
+        assert scanned_subscriptions == set(
+            test_multiple_subscriptions["subscription_id"]
+        )
+
+    def test_scan_subscription(self):
+        # Test data
+        test_subscription_id = self.data["TEST_CREDS"]["subscription_id"]
+        test_possible_labels = {
+            f"AZURE: {test_subscription_id}/global",
+            f"AZURE: {test_subscription_id}/eastus",
+        }
+
+        # Mock
+        self.mocker.patch.object(
+            self.connector.settings, "azure_refresh_all_regions", True
+        )
+        scanned_by = []
+
+        def mock_get_all_labels(connector: AzureCloudConnector):
+            connector.possible_labels.update(test_possible_labels)
 
-        # Mock get all labels
-        self.mocker.patch.object(self.connector, "get_all_labels")
         self.mocker.patch.object(
-            self.connector, "possible_labels", test_possible_labels
+            AzureCloudConnector, "get_all_labels", mock_get_all_labels
+        )
+        self.mocker.patch.object(
+            AzureCloudConnector,
+            "scan",
+            lambda connector: scanned_by.append(connector),
+        )
+        mock_delete_seeds = self.mocker.patch.object(
+            AzureCloudConnector, "delete_seeds_by_label"
         )
 
         # Actual call
-        self.connector.scan_all()
+        self.connector.scan_subscription(
+            self.connector.provider_settings,
+            self.connector.credentials,
+            test_subscription_id,
+        )
+
+        # Assertions
+        assert len(scanned_by) == 1
+        subscription_connector = scanned_by[0]
+        assert subscription_connector is not self.connector
+        assert subscription_connector.subscription_id == test_subscription_id
+        assert subscription_connector.credentials is self.connector.credentials
+        assert mock_delete_seeds.call_count == len(test_possible_labels)
+
+    def test_scan_subscription_fail(self):
+        # Mock
+        self.mocker.patch.object(
+            AzureCloudConnector, "scan", side_effect=ValueError("Test Exception")
+        )
+        mock_dispatch_event = self.mocker.patch.object(
+            AzureCloudConnector, "dispatch_event", autospec=True
+        )
+
+        # Actual call
+        self.connector.scan_subscription(
+            self.connector.provider_settings,
+            self.connector.credentials,
+            self.connector.subscription_id,
+        )
 
         # Assertions
-        assert mock_scan.call_count == 3
+        mock_dispatch_event.assert_called_once()
+        event_connector, event_type = mock_dispatch_event.call_args.args
+        assert event_type == EventTypeEnum.SCAN_FAILED
+        # The event carries the connector of the failing subscription
+        assert event_connector is not self.connector
+        assert event_connector.subscription_id == self.connector.subscription_id
+
+    def test_scan_subscription_init_fail(self):
+        # Mock
+        self.mocker.patch.object(
+            AzureCloudConnector, "__init__", side_effect=ValueError("Test Exception")
+        )
+        mock_dispatch_event = self.mocker.patch.object(
+            AzureCloudConnector, "dispatch_event", autospec=True
+        )
+
+        # Actual call
+        self.connector.scan_subscription(
+            self.connector.provider_settings,
+            self.connector.credentials,
+            self.connector.subscription_id,
+        )
+
+        # Assertions
+        mock_dispatch_event.assert_called_once()
+        event_connector, event_type = mock_dispatch_event.call_args.args
+        assert event_type == EventTypeEnum.SCAN_FAILED
+        assert event_connector is self.connector
+        assert (
+            mock_dispatch_event.call_args.kwargs["subscription_id"]
+            == self.connector.subscription_id
+        )
 
     def test_format_label(self):
         # Test data
         test_location = "test-location"
-        test_asset = self.mock_asset({"location": test_location})
+        test_asset = mock_asset({"location": test_location})
 
         # Actual call
         label = self.connector.format_label(test_asset)
@@ -135,8 +316,7 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
 
     def test_format_label_no_location(self):
         # Test data
-        test_asset = self.mock_asset({})
-        del test_asset.location
+        test_asset = mock_asset({})
 
         # Actual call
         with pytest.raises(ValueError, match="Asset has no location"):
@@ -155,11 +335,7 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
         }
 
         # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "seed_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=seed_scanners),
-        )
+        self.connector.seed_scanners = seed_scanners
 
         # Actual call
         self.connector.get_seeds()
@@ -184,11 +360,7 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
         }
 
         # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "seed_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=seed_scanners),
-        )
+        self.connector.seed_scanners = seed_scanners
 
         # Actual call
         self.connector.get_seeds()
@@ -200,115 +372,92 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
             else:
                 mock.assert_called_once()
 
-    def test_get_ip_addresses(self):
-        # Test data
-        test_list_all_response = []
-        test_seed_values = []
-        for i in range(3):
-            test_ip_response = self.data["TEST_IP_ADDRESS"].copy()
-            ip_address = test_ip_response["ip_address"][:-1] + str(i)
-            test_ip_response["ip_address"] = ip_address
-            test_seed_values.append(ip_address)
-            test_list_all_response.append(self.mock_asset(test_ip_response))
-        test_label = self.connector.format_label(test_list_all_response[0])
-
-        # Mock list_all
-        mock_network_client = self.mock_client("NetworkManagementClient")
-        mock_public_ips = self.mocker.patch.object(
-            mock_network_client.return_value, "public_ip_addresses"
-        )
-        mock_public_ips.list_all.return_value = test_list_all_response
-
-        # Actual call
-        self.connector.get_ip_addresses()
-
-        # Assertions
-        mock_network_client.assert_called_with(
-            self.connector.credentials, self.connector.subscription_id
-        )
-        mock_public_ips.list_all.assert_called_once()
-        self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_clusters(self):
+    @pytest.mark.parametrize(
+        (
+            "resource_name",
+            "client_name",
+            "client_attribute",
+            "list_method",
+            "data_key",
+            "build_responses",
+        ),
+        [
+            (
+                "ip_addresses",
+                "NetworkManagementClient",
+                "public_ip_addresses",
+                "list_all",
+                "TEST_IP_ADDRESS",
+                ip_address_responses,
+            ),
+            (
+                "clusters",
+                "ContainerInstanceManagementClient",
+                "container_groups",
+                "list",
+                "TEST_CONTAINER_ASSET",
+                container_group_responses,
+            ),
+            (
+                "sql_servers",
+                "SqlManagementClient",
+                "servers",
+                "list",
+                "TEST_SQL_SERVER",
+                sql_server_responses,
+            ),
+        ],
+        ids=["ip_addresses", "clusters", "sql_servers"],
+    )
+    def test_get_resource_seeds(
+        self,
+        resource_name: str,
+        client_name: str,
+        client_attribute: str,
+        list_method: str,
+        data_key: str,
+        build_responses: Callable[[dict, int], tuple[list[dict], list[str]]],
+    ):
         # Test data
-        test_list_response = []
-        test_seed_values = []
-        base_domain = ".eastus.azurecontainer.io"
-        for i in range(3):
-            test_container_response = self.data["TEST_CONTAINER_ASSET"].copy()
-            ip_address_copy = test_container_response["ip_address"].copy()
-            ip_address = ip_address_copy["ip"][:-1] + str(i)
-            ip_address_copy["ip"] = ip_address
-            test_seed_values.append(ip_address)
-            domain = f"test-{i}" + base_domain
-            ip_address_copy["fqdn"] = domain
-            test_seed_values.append(domain)
-            test_container_response["ip_address"] = ip_address_copy
-            test_list_response.append(self.mock_asset(test_container_response))
-        test_label = self.connector.format_label(test_list_response[0])
+        test_responses, test_seed_values = build_responses(self.data[data_key], 3)
+        test_list_response = [mock_asset(r) for r in test_responses]
+        test_label = self.expected_label(self.data[data_key]["location"])
 
         # Mock list
-        mock_container_client = self.mock_client("ContainerInstanceManagementClient")
-        mock_container_groups = self.mocker.patch.object(
-            mock_container_client.return_value, "container_groups"
+        mock_client = self.mock_client(client_name)
+        mock_resources = self.mocker.patch.object(
+            mock_client.return_value, client_attribute
         )
-        mock_container_groups.list.return_value = test_list_response
+        mock_list = getattr(mock_resources, list_method)
+        mock_list.return_value = test_list_response
 
         # Actual call
-        self.connector.get_clusters()
+        getattr(self.connector, f"get_{resource_name}")()
 
         # Assertions
-        mock_container_client.assert_called_with(
+        mock_client.assert_called_with(
             self.connector.credentials, self.connector.subscription_id
         )
-        mock_container_groups.list.assert_called_once()
-        self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_sql_servers(self):
-        # Test data
-        test_list_response = []
-        test_seed_values = []
-        for i in range(3):
-            test_server_response = self.data["TEST_SQL_SERVER"].copy()
-            domain = f"test-{i}" + test_server_response["fully_qualified_domain_name"]
-            test_server_response["fully_qualified_domain_name"] = domain
-            test_seed_values.append(domain)
-            test_list_response.append(self.mock_asset(test_server_response))
-        test_label = self.connector.format_label(test_list_response[0])
-
-        # Mock list
-        mock_sql_client = self.mock_client("SqlManagementClient")
-        mock_servers = self.mocker.patch.object(mock_sql_client.return_value, "servers")
-        mock_servers.list.return_value = test_list_response
-
-        # Actual call
-        self.connector.get_sql_servers()
-
-        # Assertions
-        mock_sql_client.assert_called_with(
-            self.connector.credentials, self.connector.subscription_id
-        )
-        mock_servers.list.assert_called_once()
+        mock_list.assert_called_once()
         self.assert_seeds_with_values(
             self.connector.seeds[test_label], test_seed_values
         )
 
     def test_get_dns_records(self):
         # Test data
-        test_zones = [self.mock_asset(self.data["TEST_DNS_ZONE"])]
-        test_label = self.connector.format_label(test_zones[0])
-        test_list_records = []
+        test_zones = [mock_asset(self.data["TEST_DNS_ZONE"])]
+        test_label = self.expected_label(self.data["TEST_DNS_ZONE"]["location"])
+        test_records = [
+            self.data[data_key]
+            for data_key in [
+                "TEST_DNS_RECORD_A",
+                "TEST_DNS_RECORD_SOA",
+                "TEST_DNS_RECORD_CNAME",
+            ]
+        ]
+        test_list_records = [mock_asset(record) for record in test_records]
         test_seed_values = []
-        for data_key in [
-            "TEST_DNS_RECORD_A",
-            "TEST_DNS_RECORD_SOA",
-            "TEST_DNS_RECORD_CNAME",
-        ]:
-            test_record = self.data[data_key].copy()
+        for test_record in test_records:
             domain = test_record["fqdn"]
             if domain.endswith("."):
                 domain = domain[:-1]
@@ -317,7 +466,6 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
                 test_seed_values.extend([a["ipv4_address"] for a in a_records])
             if cname_record := test_record.get("cname_record"):
                 test_seed_values.append(cname_record["cname"])
-            test_list_records.append(self.mock_asset(test_record))
 
         # Mock list
         mock_dns_client = self.mock_client("DnsManagementClient")
@@ -368,11 +516,7 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
         }
 
         # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "cloud_asset_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=cloud_asset_scanners),
-        )
+        self.connector.cloud_asset_scanners = cloud_asset_scanners
 
         # Actual call
         self.connector.get_cloud_assets()
@@ -387,35 +531,42 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
             self.data["TEST_CREDS_IGNORE"]
         )
 
+        mock_storage_containers = self.mocker.Mock()
+
         # Mock
-        mock_storage_container = self.mocker.patch.object(
-            self.connector, "get_storage_containers"
-        )
+        self.connector.cloud_asset_scanners = {
+            AzureResourceTypes.STORAGE_ACCOUNTS: mock_storage_containers,
+        }
 
         # Actual call
         self.connector.get_cloud_assets()
 
         # Assertions
-        mock_storage_container.assert_not_called()
+        mock_storage_containers.assert_not_called()
 
     def test_get_storage_containers(self):
         # Test data
-        test_storage_accounts = []
-        test_containers = []
-        test_seed_values = []
-        for i in range(3):
-            test_storage_account = self.data["TEST_STORAGE_ACCOUNT"].copy()
-            test_storage_account["name"] = f"test-{i}"
-            if custom_domain := test_storage_account.get("custom_domain"):
-                custom_domain_copy = custom_domain.copy()
-                custom_domain_copy["name"] = f"test-{i}.blobs.censys.io"
-                test_seed_values.append(custom_domain_copy["name"])
-                test_storage_account["custom_domain"] = custom_domain_copy
-            test_storage_accounts.append(self.mock_asset(test_storage_account))
-            test_container = self.data["TEST_STORAGE_CONTAINER"].copy()
-            test_container["name"] = f"test-{i}"
-            test_containers.append(self.mock_asset(test_container))
-        test_label = self.connector.format_label(test_storage_accounts[0])
+        test_storage_account = self.data["TEST_STORAGE_ACCOUNT"]
+        test_names = [f"test-{i}" for i in range(3)]
+        test_seed_values = [f"{name}.blobs.censys.io" for name in test_names]
+        test_storage_accounts = [
+            mock_asset(
+                {
+                    **test_storage_account,
+                    "name": name,
+                    "custom_domain": {
+                        **test_storage_account["custom_domain"],
+                        "name": domain,
+                    },
+                }
+            )
+            for name, domain in zip(test_names, test_seed_values)
+        ]
+        test_containers = [
+            mock_asset({**self.data["TEST_STORAGE_CONTAINER"], "name": name})
+            for name in test_names
+        ]
+        test_label = self.expected_label(self.data["TEST_STORAGE_ACCOUNT"]["location"])
 
         # Mock list
         mock_storage_client = self.mock_client("StorageManagementClient")
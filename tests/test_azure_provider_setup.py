@@ -1,5 +1,6 @@
 import json
 import time
+from typing import Optional
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -43,24 +44,29 @@ class TestAzureProviderSetup(BaseCase, TestCase):
             f"censys.cloud_connectors.azure_connector.{module_name}.{client_name}"
         )
 
+    def mock_az_path(self, path: Optional[str] = "/usr/bin/az") -> MagicMock:
+        return self.mocker.patch(
+            "censys.cloud_connectors.azure_connector.provider_setup.shutil.which",
+            return_value=path,
+        )
+
     def test_get_subscriptions_from_cli(self):
         # Test data
         subscription_side_effects = []
-        for i in range(3):
-            mock_subscription = self.mocker.MagicMock()
+        for i, state in enumerate(["Enabled", "Enabled", "Enabled", "Disabled"]):
+            mock_subscription = self.mocker.MagicMock(state=state)
             mock_subscription.as_dict.return_value = {
                 "subscription_id": f"subscription_{i}",
                 "display_name": f"Subscription {i}",
-                "state": "Enabled",
+                "state": state,
             }
             subscription_side_effects.append(mock_subscription)
 
         # Mock list
-        mock_cli_credentials = self.mocker.patch("azure.identity.AzureCliCredential")
+        self.mock_az_path()
+        mock_cli_credentials = self.mock_client("AzureCliCredential")
         mock_cli_credentials.return_value = None
-        mock_subscription_client = self.mocker.patch(
-            "azure.mgmt.resource.SubscriptionClient"
-        )
+        mock_subscription_client = self.mock_client("SubscriptionClient")
         mock_subscription_client.return_value.subscriptions.list.return_value = (
             subscription_side_effects
         )
@@ -69,22 +75,36 @@ class TestAzureProviderSetup(BaseCase, TestCase):
         subscriptions = self.setup_cli.get_subscriptions_from_cli()
 
         # Assertions
-        assert len(subscriptions) == len(subscription_side_effects)
+        assert subscriptions == [
+            subscription.as_dict.return_value
+            for subscription in subscription_side_effects[:-1]
+        ], "Disabled subscriptions should not be returned"
 
-    @parameterized.expand(
-        [
-            (CredentialUnavailableError, "Unable to get subscriptions from the CLI"),
-            (ImportError, "Please install the Azure SDK for Python"),
-        ]
-    )
-    def test_get_subscriptions_from_cli_fail(self, exception, expected_message):
+    def test_get_cli_subscription_client_is_reused(self):
+        # Mock
+        mock_cli_credentials = self.mock_client("AzureCliCredential")
+        mock_subscription_client = self.mock_client("SubscriptionClient")
+
+        # Actual calls
+        first_client = self.setup_cli.get_cli_subscription_client()
+        second_client = self.setup_cli.get_cli_subscription_client()
+
+        # Assertions
+        assert first_client is second_client
+        mock_cli_credentials.assert_called_once()
+        mock_subscription_client.assert_called_once_with(
+            mock_cli_credentials.return_value
+        )
+
+    def test_get_subscriptions_from_cli_fail(self):
         # Mock list
-        mock_cli_credentials = self.mocker.patch("azure.identity.AzureCliCredential")
+        self.mock_az_path()
+        mock_cli_credentials = self.mock_client("AzureCliCredential")
         mock_cli_credentials.return_value = None
-        mock_subscription_client = self.mocker.patch(
-            "azure.mgmt.resource.SubscriptionClient"
+        mock_subscription_client = self.mock_client("SubscriptionClient")
+        mock_subscription_client.return_value.subscriptions.list.side_effect = (
+            CredentialUnavailableError
         )
-        mock_subscription_client.return_value.subscriptions.list.side_effect = exception
         mock_print_warning = self.mocker.patch.object(self.setup_cli, "print_warning")
 
         # Actual call
@@ -92,7 +112,24 @@ class TestAzureProviderSetup(BaseCase, TestCase):
 
         # Assertions
         assert len(subscriptions) == 0, "No subscriptions should be returned"
-        mock_print_warning.assert_called_once_with(expected_message)
+        mock_print_warning.assert_called_once_with(
+            "Unable to get subscriptions from the CLI"
+        )
+
+    def test_get_subscriptions_from_cli_without_az(self):
+        # Mock
+        mock_which = self.mock_az_path(None)
+        mock_subscription_client = self.mock_client("SubscriptionClient")
+        mock_print_warning = self.mocker.patch.object(self.setup_cli, "print_warning")
+
+        # Actual call
+        subscriptions = self.setup_cli.get_subscriptions_from_cli()
+
+        # Assertions
+        assert subscriptions == []
+        mock_which.assert_called_once_with("az")
+        mock_subscription_client.assert_not_called()
+        mock_print_warning.assert_called_once_with("Please install the Azure CLI")
 
     def test_prompt_select_subscriptions(self):
         # Test data
@@ -105,14 +142,6 @@ class TestAzureProviderSetup(BaseCase, TestCase):
                     "state": "Enabled",
                 }
             )
-        # This would not be selectable
-        test_subscriptions.append(
-            {
-                "subscription_id": "subscription_3",
-                "display_name": "Subscription 3",
-                "state": "Disabled",
-            }
-        )
 
         # Mock prompt
         mock_prompt = self.mocker.patch.object(self.setup_cli, "prompt")
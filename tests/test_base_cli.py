@@ -56,6 +56,21 @@ class TestBaseCli(BaseCase, TestCase):
         ]
         mock_print.assert_has_calls(calls)
 
+    def test_print_command_list(self):
+        # Mock
+        self.mocker.patch("censys.cloud_connectors.common.cli.base.print")
+        mock_syntax = self.mocker.patch(
+            "censys.cloud_connectors.common.cli.base.Syntax"
+        )
+
+        # Actual call
+        self.base_cli.print_command(["test", "--name", "Test Command"])
+
+        # Assertions
+        mock_syntax.assert_called_once_with(
+            "test --name 'Test Command'", "bash", word_wrap=True
+        )
+
     def test_print_json(self):
         # Test data
         test_json_object = {"test": "json"}
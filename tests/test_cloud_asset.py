@@ -35,6 +35,20 @@ class CloudAssetTest(BaseCase, TestCase):
             "scanData": '{"test_scan_data": "test_scan_data"}',
         }
 
+    def test_cloud_asset_to_dict_is_cached(self):
+        cloud_asset = CloudAsset(
+            type=TEST_TYPE,
+            value=TEST_VALUE,
+            csp_label=ProviderEnum.GCP,
+            scan_data=TEST_SCAN_DATA,
+            uid=TEST_UID,
+        )
+        assert cloud_asset.to_dict() is cloud_asset.to_dict()
+
+        # Assigning a field clears the cache
+        cloud_asset.scan_data = {}
+        assert cloud_asset.to_dict()["scanData"] == "{}"
+
     def test_object_storage_asset(self):
         cloud_asset = ObjectStorageAsset(
             value=TEST_VALUE, csp_label=ProviderEnum.GCP, uid=TEST_UID
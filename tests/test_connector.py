@@ -1,12 +1,16 @@
+import threading
 from unittest import TestCase
 
 import pytest
+from parameterized import parameterized
+from requests.adapters import DEFAULT_POOLSIZE
 
+from censys.asm import Beta
 from censys.common.exceptions import CensysAsmException, CensysException
 
 from censys.cloud_connectors.common.cloud_asset import CloudAsset
 from censys.cloud_connectors.common.connector import CloudConnector
-from censys.cloud_connectors.common.enums import ProviderEnum
+from censys.cloud_connectors.common.enums import EventTypeEnum, ProviderEnum
 from censys.cloud_connectors.common.seed import Seed
 from censys.cloud_connectors.common.settings import Settings
 from tests.base_connector_case import BaseConnectorCase
@@ -56,6 +60,137 @@ class TestCloudConnector(BaseConnectorCase, TestCase):
         with pytest.raises(CensysException, match="No ASM API key configured."):
             ExampleCloudConnector(test_settings)
 
+    def test_api_clients_are_shared(self):
+        # Actual call
+        other_connector = ExampleCloudConnector(self.settings)
+
+        # Assertions
+        assert other_connector.seeds_api is self.connector.seeds_api
+        assert other_connector.beta_api is self.connector.beta_api
+        assert self.connector.seeds_api is not self.connector.beta_api
+
+    def test_api_clients_not_shared_between_api_keys(self):
+        # Test data
+        test_settings = Settings(
+            **{**self.default_settings, "censys_api_key": "x" * 36},
+        )
+
+        # Actual call
+        other_connector = ExampleCloudConnector(test_settings)
+
+        # Assertions
+        assert other_connector.seeds_api is not self.connector.seeds_api
+        assert other_connector.seeds_api._api_key == "x" * 36
+
+    def test_api_clients_use_max_retries(self):
+        # Test data
+        test_settings = Settings(
+            **{**self.default_settings, "censys_max_retries": 10},
+        )
+
+        # Actual call
+        other_connector = ExampleCloudConnector(test_settings)
+
+        # Assertions
+        assert other_connector.seeds_api is not self.connector.seeds_api
+        assert other_connector.seeds_api.max_retries == 10
+
+    @parameterized.expand([(3, 5, 15), (1, 1, DEFAULT_POOLSIZE)])
+    def test_api_clients_pool_size(
+        self, max_concurrent_submissions, max_concurrent_subscriptions, pool_maxsize
+    ):
+        # Test data
+        test_settings = Settings(
+            **{
+                **self.default_settings,
+                "max_concurrent_submissions": max_concurrent_submissions,
+                "max_concurrent_subscriptions": max_concurrent_subscriptions,
+            },
+        )
+
+        # Actual call
+        connector = ExampleCloudConnector(test_settings)
+
+        # Assertions
+        adapter = connector.seeds_api._session.get_adapter("https://")
+        assert adapter._pool_maxsize == pool_maxsize
+
+    def test_beta_api_created_on_first_use(self):
+        # Mock
+        get_or_create_api_mock = self.mocker.patch.object(
+            ExampleCloudConnector, "_get_or_create_api"
+        )
+
+        # Actual call
+        connector = ExampleCloudConnector(self.settings)
+
+        # Assertions
+        assert "beta_api" not in connector.__dict__
+        assert connector.beta_api is connector.beta_api
+        get_or_create_api_mock.assert_called_with(Beta, self.settings)
+        assert get_or_create_api_mock.call_count == 2
+
+    def test_get_seeds_runs_scanners_concurrently(self):
+        # Test data
+        barrier = threading.Barrier(2, timeout=5)
+        scanned_services = {}
+
+        def make_scanner(service: str):
+            def scanner():
+                # Both scanners must be running at once to pass the barrier
+                barrier.wait()
+                scanned_services[service] = self.connector.get_event_context(
+                    EventTypeEnum.SEED_FOUND
+                )["service"]
+
+            return scanner
+
+        # Mock
+        self.connector.provider_settings = self.mocker.MagicMock(ignore=["ignored"])
+        self.connector.seed_scanners = {
+            service: make_scanner(service) for service in ["first", "second"]
+        }
+        ignored_scanner = self.mocker.MagicMock()
+        self.connector.seed_scanners["ignored"] = ignored_scanner
+
+        # Actual call
+        self.connector.get_seeds()
+
+        # Assertions
+        assert scanned_services == {"first": "first", "second": "second"}
+        ignored_scanner.assert_not_called()
+        assert (
+            self.connector.get_event_context(EventTypeEnum.SEED_FOUND)["service"]
+            is None
+        )
+
+    def test_get_cloud_assets_raises_scanner_error(self):
+        # Mock
+        self.connector.provider_settings = self.mocker.MagicMock(ignore=None)
+        self.connector.cloud_asset_scanners = {
+            "failing": self.mocker.MagicMock(side_effect=ValueError("Test Exception"))
+        }
+
+        # Assertions
+        with pytest.raises(ValueError, match="Test Exception"):
+            self.connector.get_cloud_assets()
+
+    def test_scan_many(self):
+        # Test data
+        barrier = threading.Barrier(2, timeout=5)
+        scanned_items = []
+
+        def scan_item(item: str):
+            # Both items must be scanned at once to pass the barrier
+            barrier.wait()
+            scanned_items.append(item)
+
+        # Actual call
+        self.connector._scan_many(["first", "second"], scan_item)
+
+        # Assertions
+        assert sorted(scanned_items) == ["first", "second"]
+
     def test_add_seed(self):
         seed = Seed(type="TEST", value="test-value", label="test-label")
         self.connector.add_seed(seed)
@@ -63,6 +198,22 @@ class TestCloudConnector(BaseConnectorCase, TestCase):
         assert len(self.connector.seeds[test_label]) == 1
         assert self.connector.seeds[test_label].pop() == seed
 
+    def test_add_seed_skips_serialization_without_debug(self):
+        # Test data
+        seed = Seed(type="TEST", value="test-value", label="test-label")
+
+        # Mock
+        self.mocker.patch.object(
+            self.connector.logger, "isEnabledFor", return_value=False
+        )
+        to_dict_mock = self.mocker.patch.object(Seed, "to_dict")
+
+        # Actual call
+        self.connector.add_seed(seed)
+
+        # Assertions
+        to_dict_mock.assert_not_called()
+
     def test_add_cloud_asset(self):
         asset = CloudAsset(
             type="TEST", value="test-value", csp_label=ProviderEnum.GCP, uid="test-uid"
@@ -84,6 +235,29 @@ class TestCloudConnector(BaseConnectorCase, TestCase):
             [seed.to_dict()],
         )
 
+    def test_submit_seeds_multiple_labels(self):
+        # Test data
+        test_labels = [f"test-label-{i}" for i in range(3)]
+        for label in test_labels:
+            self.connector.add_seed(Seed(type="TEST", value="test-value", label=label))
+
+        # Mock
+        replace_seeds_mock = self.mocker.patch.object(
+            self.connector.seeds_api, "replace_seeds_by_label"
+        )
+        logger_mock = self.mocker.patch.object(self.connector.logger, "info")
+
+        # Actual call
+        self.connector.submit_seeds()
+
+        # Assertions
+        assert replace_seeds_mock.call_count == len(test_labels)
+        submitted_labels = {call.args[0] for call in replace_seeds_mock.call_args_list}
+        assert submitted_labels == {
+            self.connector.label_prefix + label for label in test_labels
+        }
+        logger_mock.assert_called_once_with(f"Submitted {len(test_labels)} seeds.")
+
     def test_fail_submit_seeds(self):
         seed = Seed(type="TEST", value="test-value", label="test-label")
         self.connector.add_seed(seed)
@@ -115,6 +289,33 @@ class TestCloudConnector(BaseConnectorCase, TestCase):
             self.connector.label_prefix + "test-uid", [asset.to_dict()]
         )
 
+    def test_submit_cloud_assets_multiple_uids(self):
+        # Test data
+        test_uids = [f"test-uid-{i}" for i in range(3)]
+        for uid in test_uids:
+            self.connector.add_cloud_asset(
+                CloudAsset(
+                    type="TEST", value="test-value", csp_label=ProviderEnum.GCP, uid=uid
+                )
+            )
+
+        # Mock
+        add_cloud_mock = self.mocker.patch.object(
+            self.connector.beta_api, "add_cloud_assets"
+        )
+        logger_mock = self.mocker.patch.object(self.connector.logger, "info")
+
+        # Actual call
+        self.connector.submit_cloud_assets()
+
+        # Assertions
+        assert add_cloud_mock.call_count == len(test_uids)
+        submitted_uids = {call.args[0] for call in add_cloud_mock.call_args_list}
+        assert submitted_uids == {
+            self.connector.label_prefix + uid for uid in test_uids
+        }
+        logger_mock.assert_called_once_with(f"Submitted {len(test_uids)} cloud assets.")
+
     def test_fail_submit_cloud_assets(self):
         # Test data
         asset = CloudAsset(
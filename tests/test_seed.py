@@ -27,6 +27,14 @@ class SeedTest(TestCase):
             "value": test_value,
         }
 
+    def test_seed_to_dict_is_cached(self):
+        seed = Seed(type="test", value="test-seed-value", label=TEST_LABEL)
+        assert seed.to_dict() is seed.to_dict()
+
+        # Assigning a field clears the cache
+        seed.value = "new-seed-value"
+        assert seed.to_dict() == {"type": "test", "value": "new-seed-value"}
+
     def test_asn_seed(self):
         test_value = 123
         seed = AsnSeed(value=test_value, label=TEST_LABEL)
@@ -1,5 +1,14 @@
+import json
+from collections.abc import Mapping
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
 import yaml
 
+DATA_DIR = Path(__file__).parent / "data"
+
 
 def assert_same_yaml(file_a: str, file_b: str):
     """Assert that two yaml files are the same.
@@ -16,3 +25,37 @@ def assert_same_yaml(file_a: str, file_b: str):
     with open(file_b) as f:
         b = yaml.safe_load(f)
     assert a == b, f"{file_a} != {file_b}"
+
+
+def freeze(value: Any) -> Any:
+    """Recursively make parsed JSON read-only.
+
+    Dicts are wrapped in a MappingProxyType and lists are turned into tuples.
+
+    Args:
+        value (Any): The parsed JSON value.
+
+    Returns:
+        Any: The read-only value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@cache
+def load_test_data(file_name: str) -> Mapping[str, Any]:
+    """Load a JSON file from the test data directory.
+
+    The result is cached for the whole session and frozen so it cannot be
+    mutated by accident, build modified copies with dict unpacking instead.
+
+    Args:
+        file_name (str): The file name, relative to the test data directory.
+
+    Returns:
+        Mapping[str, Any]: The parsed, read-only JSON.
+    """
+    return freeze(json.loads((DATA_DIR / file_name).read_bytes()))